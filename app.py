@@ -6,7 +6,10 @@ from bs4 import BeautifulSoup
 import re
 import time
 import io
+import gzip
+import heapq
 from urllib.parse import urljoin, urlparse, urlencode, parse_qs
+from urllib.robotparser import RobotFileParser
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # --- Import Google Search Library ---
@@ -76,6 +79,19 @@ UNNAMED_GROUP_PLACEHOLDER = "Unnamed Group"
 IMAGE_PATTERN_PPS = re.compile(r'https:\/\/pps\.whatsapp\.net\/v\/t\d+\/[-\w]+\/\d+\.jpg\?')
 OG_IMAGE_PATTERN = re.compile(r'https?:\/\/[^\/\s]+\/[^\/\s]+\.(jpg|jpeg|png)(\?[^\s]*)?')
 MAX_VALIDATION_WORKERS = 8
+LIVE_REFRESH_INTERVAL_SECONDS = 1.0
+LIVE_RESULTS_PREVIEW_ROWS = 200
+RESULTS_COLUMN_CONFIG = {
+    "Group Link": st.column_config.LinkColumn("Invite Link", display_text="Join", width="medium"),
+    "Group Name": st.column_config.TextColumn("Group Name", width="large"),
+    "Logo URL": st.column_config.LinkColumn("Logo URL", display_text="View", width="small"),
+    "Status": st.column_config.TextColumn("Status", width="small")
+}
+SITEMAP_MAX_FILES = 10
+DISCOVERY_PRIOR_PAGES = 2
+DISCOVERY_POSITIVE_TOKENS = {"whatsapp", "wa", "group", "groups", "invite", "invites", "join", "link", "links", "chat", "chats", "community", "communities"}
+DISCOVERY_NEGATIVE_TOKENS = {"login", "signin", "signup", "register", "account", "cart", "checkout", "privacy", "terms", "policy", "contact", "about", "feed", "rss", "wp", "admin", "cdn", "static", "assets"}
+NON_HTML_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.ico', '.pdf', '.zip', '.rar', '.mp3', '.mp4', '.avi', '.css', '.js', '.xml', '.json', '.txt')
 
 # --- Custom CSS ---
 st.markdown("""
@@ -222,6 +238,24 @@ def validate_link(link):
     except Exception as e: result["Status"] = f"Parsing Error ({type(e).__name__})"
     return result
 
+def extract_whatsapp_links_from_soup(soup):
+    links = set()
+    for a_tag in soup.find_all('a', href=True):
+        href = a_tag.get('href')
+        if href and href.startswith(WHATSAPP_DOMAIN):
+            parsed_url = urlparse(href)
+            links.add(f"{parsed_url.scheme}://{parsed_url.netloc}{parsed_url.path}")
+    text_content = soup.get_text()
+    if WHATSAPP_DOMAIN in text_content:
+        for link_url in re.findall(r'(https?://chat\.whatsapp\.com/[^\s"\'<>()\[\]{}]+)', text_content):
+            clean_link = re.sub(r'[.,;!?"\'<>)]+$', '', link_url)
+            clean_link = re.sub(r'(\.[a-zA-Z]{2,4})$', '', clean_link) if not clean_link.endswith(('.html', '.htm', '.php')) else clean_link
+            clean_link = clean_link.split('&')[0] 
+            parsed_url = urlparse(clean_link)
+            if len(parsed_url.path.replace('/', '')) > 15:
+                links.add(f"{parsed_url.scheme}://{parsed_url.netloc}{parsed_url.path}")
+    return links
+
 def scrape_whatsapp_links_from_page(url, session=None):
     links = set()
     try:
@@ -230,20 +264,7 @@ def scrape_whatsapp_links_from_page(url, session=None):
         response.encoding = 'utf-8'
         response.raise_for_status()
         soup = BeautifulSoup(response.text, 'html.parser')
-        for a_tag in soup.find_all('a', href=True):
-            href = a_tag.get('href')
-            if href and href.startswith(WHATSAPP_DOMAIN):
-                parsed_url = urlparse(href)
-                links.add(f"{parsed_url.scheme}://{parsed_url.netloc}{parsed_url.path}")
-        text_content = soup.get_text()
-        if WHATSAPP_DOMAIN in text_content:
-            for link_url in re.findall(r'(https?://chat\.whatsapp\.com/[^\s"\'<>()\[\]{}]+)', text_content):
-                clean_link = re.sub(r'[.,;!?"\'<>)]+$', '', link_url)
-                clean_link = re.sub(r'(\.[a-zA-Z]{2,4})$', '', clean_link) if not clean_link.endswith(('.html', '.htm', '.php')) else clean_link
-                clean_link = clean_link.split('&')[0] 
-                parsed_url = urlparse(clean_link)
-                if len(parsed_url.path.replace('/', '')) > 15:
-                    links.add(f"{parsed_url.scheme}://{parsed_url.netloc}{parsed_url.path}")
+        links = extract_whatsapp_links_from_soup(soup)
     except requests.exceptions.Timeout: st.sidebar.warning(f"Scrape Timeout: {url[:50]}...", icon="⏱️")
     except requests.exceptions.HTTPError as e: st.sidebar.warning(f"Scrape HTTP Err {e.response.status_code}: {url[:50]}...", icon="⚠️")
     except requests.exceptions.RequestException as e: st.sidebar.warning(f"Scrape Net Err ({type(e).__name__}): {url[:50]}...", icon="⚠️")
@@ -285,7 +306,64 @@ def google_search_and_scrape(query, top_n=5):
         st.error(f"Unexpected Google search/scrape error for '{query}': {e}. Check connection/library.", icon="❌")
         return []
 
-def crawl_website(start_url, max_depth=2, max_pages=50):
+def tokenize_for_discovery(text):
+    return {tok for tok in re.split(r'[^a-z0-9]+', (text or '').lower()) if len(tok) > 1 and not tok.isdigit()}
+
+def fetch_sitemap_seed_urls(session, start_url, base_domain, max_urls):
+    parsed_start_url = urlparse(start_url)
+    site_root = f"{parsed_start_url.scheme}://{parsed_start_url.netloc}"
+    robots_parser, sitemap_queue = None, []
+    try:
+        response = session.get(f"{site_root}/robots.txt", headers=get_random_headers_general(), timeout=10)
+        if response.status_code == 200:
+            robots_lines = response.text.splitlines()
+            robots_parser = RobotFileParser(); robots_parser.parse(robots_lines)
+            sitemap_queue = [line.split(':', 1)[1].strip() for line in robots_lines if line.strip().lower().startswith('sitemap:')]
+    except requests.exceptions.RequestException as e: st.sidebar.warning(f"robots.txt Err ({type(e).__name__}): {site_root}", icon="🤖")
+    if not sitemap_queue: sitemap_queue = [f"{site_root}/sitemap.xml", f"{site_root}/sitemap_index.xml"]
+
+    seed_urls, seen_sitemaps = [], set()
+    while sitemap_queue and len(seen_sitemaps) < SITEMAP_MAX_FILES and len(seed_urls) < max_urls:
+        sitemap_url = sitemap_queue.pop(0)
+        if sitemap_url in seen_sitemaps: continue
+        seen_sitemaps.add(sitemap_url)
+        try:
+            response = session.get(sitemap_url, headers=get_random_headers_general(), timeout=10)
+            if response.status_code != 200: continue
+            content = response.content
+            if content[:2] == b'\x1f\x8b': content = gzip.decompress(content)
+            soup = BeautifulSoup(content, 'html.parser')
+            locs = [loc.get_text().strip() for loc in soup.find_all('loc') if loc.get_text().strip()]
+            if soup.find('sitemapindex'):
+                # Child sitemaps whose names hint at groups/invites are read first.
+                sitemap_queue.extend(sorted(locs, key=lambda u: -len(tokenize_for_discovery(urlparse(u).path) & DISCOVERY_POSITIVE_TOKENS)))
+                continue
+            for loc in locs:
+                parsed_loc = urlparse(loc)
+                if parsed_loc.scheme in ['http', 'https'] and parsed_loc.netloc.replace('www.', '') == base_domain:
+                    seed_urls.append(loc)
+        except requests.exceptions.RequestException as e: st.sidebar.warning(f"Sitemap Req Err ({type(e).__name__}): {sitemap_url[:50]}...", icon="🗺️")
+        except Exception as e: st.sidebar.warning(f"Sitemap Parse Err ({type(e).__name__}): {sitemap_url[:50]}...", icon="🗺️")
+    if seed_urls: st.sidebar.info(f"Seeded {min(len(seed_urls), max_urls)} URLs from {len(seen_sitemaps)} sitemap(s).")
+    return seed_urls[:max_urls], robots_parser
+
+def score_discovery_url(url, anchor_text="", parent_yield=0, depth=0, token_yield=None, site_yield=None):
+    parsed_url = urlparse(url)
+    url_tokens = tokenize_for_discovery(f"{parsed_url.path} {parsed_url.query}")
+    anchor_tokens = tokenize_for_discovery(anchor_text)
+    score = 3.0 * len(url_tokens & DISCOVERY_POSITIVE_TOKENS) - 2.0 * len(url_tokens & DISCOVERY_NEGATIVE_TOKENS)
+    score += 2.0 * len(anchor_tokens & DISCOVERY_POSITIVE_TOKENS) - 1.0 * len(anchor_tokens & DISCOVERY_NEGATIVE_TOKENS)
+    score += 0.5 * min(parent_yield, 20)
+    learned_stats = [token_yield[tok] for tok in url_tokens if tok in token_yield] if token_yield else []
+    if learned_stats and site_yield and site_yield[0]:
+        # Online-learned part: mean per-token yield, smoothed toward the site-wide rate, relative to that rate,
+        # so tokens from sections that produced nothing push a URL down.
+        site_rate = site_yield[1] / site_yield[0]
+        mean_rate = sum((links + DISCOVERY_PRIOR_PAGES * site_rate) / (pages + DISCOVERY_PRIOR_PAGES) for pages, links in learned_stats) / len(learned_stats)
+        score += max(-5.0, min(2.0 * (mean_rate - site_rate), 5.0))
+    return score - 0.5 * depth
+
+def crawl_website(start_url, max_depth=2, max_pages=50, discovery_mode=False):
     scraped_whatsapp_links = set()
     if not start_url.strip(): return scraped_whatsapp_links
     if not start_url.startswith(('http://', 'https://')):
@@ -294,25 +372,68 @@ def crawl_website(start_url, max_depth=2, max_pages=50):
     if not parsed_start_url.netloc:
         st.sidebar.error(f"Invalid start URL: {start_url}", icon="🚫"); return scraped_whatsapp_links
     base_domain = parsed_start_url.netloc.replace('www.', '')
-    urls_in_queue_tuples, visited_urls, queue_list = set(), set(), []
-    queue_list.append((start_url, 0)); urls_in_queue_tuples.add((start_url, 0))
-    page_count, max_q_size = 0, max_pages * 10
-    with requests.Session() as session, st.spinner(f"Crawling {base_domain}..."):
-        while queue_list and page_count < max_pages:
-            if len(queue_list) > max_q_size:
-                st.sidebar.warning(f"Queue > {max_q_size}. Stopping.", icon="❗️"); queue_list = queue_list[:max_q_size]
-            current_url, depth = queue_list.pop(0)
+    # Frontier is a heap of (priority, tie_breaker, url, depth, anchor_text, parent_yield). BFS orders by depth
+    # (same as a FIFO queue); discovery mode orders by descending score_discovery_url(). best_priority keeps the
+    # best priority queued per normalized URL: a better score pushes a new entry and the worse one is dropped on
+    # pop by the visited_urls check.
+    frontier, best_priority, visited_urls, token_yield, site_yield = [], {}, set(), {}, [0, 0]
+    page_count, max_q_size, push_count, robots_parser, queue_capped = 0, max_pages * 10, 0, None, False
+
+    def discovery_priority(url, depth, anchor_text, parent_yield):
+        return -score_discovery_url(url, anchor_text, parent_yield, depth, token_yield, site_yield)
+
+    def push(priority, url, depth, anchor_text, parent_yield):
+        nonlocal push_count
+        heapq.heappush(frontier, (priority, push_count, url, depth, anchor_text, parent_yield)); push_count += 1
+        best_priority[urljoin(url, urlparse(url).path or '/')] = priority
+
+    def enqueue(url, depth, anchor_text="", parent_yield=0):
+        normalized_url = urljoin(url, urlparse(url).path or '/')
+        if normalized_url in visited_urls: return
+        if discovery_mode:
+            if urlparse(url).path.lower().endswith(NON_HTML_EXTENSIONS): return
+            if robots_parser is not None and not robots_parser.can_fetch('*', url): return
+            priority = discovery_priority(url, depth, anchor_text, parent_yield)
+        else:
+            priority = depth
+        if normalized_url in best_priority and priority >= best_priority[normalized_url]: return
+        push(priority, url, depth, anchor_text, parent_yield)
+
+    with requests.Session() as session, st.spinner(f"Crawling {base_domain}{' (discovery mode)' if discovery_mode else ''}..."):
+        enqueue(start_url, 0)
+        if discovery_mode and max_depth >= 1:
+            # Sitemap URLs count as one hop from the start page, so depth 0 still means "start page only".
+            seed_urls, robots_parser = fetch_sitemap_seed_urls(session, start_url, base_domain, max_q_size - 1)
+            for seed_url in seed_urls: enqueue(seed_url, 1)
+        while frontier and page_count < max_pages:
+            if len(frontier) > max_q_size:
+                if not queue_capped:
+                    st.sidebar.warning(f"Queue > {max_q_size}. Dropping lowest-priority URLs.", icon="❗️"); queue_capped = True
+                frontier.sort()
+                for evicted in frontier[max_q_size:]:
+                    evicted_url = urljoin(evicted[2], urlparse(evicted[2]).path or '/')
+                    if best_priority.get(evicted_url) == evicted[0]: del best_priority[evicted_url]
+                del frontier[max_q_size:]
+            priority, _, current_url, depth, anchor_text, parent_yield = heapq.heappop(frontier)
             normalized_current_url = urljoin(current_url, urlparse(current_url).path or '/')
             if normalized_current_url in visited_urls or depth > max_depth: continue
+            if discovery_mode:
+                # Re-score with what the crawl has learned since this entry was queued; defer it if it now ranks lower.
+                fresh_priority = discovery_priority(current_url, depth, anchor_text, parent_yield)
+                if fresh_priority > priority and frontier and fresh_priority > frontier[0][0]:
+                    push(fresh_priority, current_url, depth, anchor_text, parent_yield); continue
             visited_urls.add(normalized_current_url)
+            best_priority.pop(normalized_current_url, None)
             if page_count >= max_pages: break
-            st.sidebar.text(f"Crawl (D:{depth},P:{page_count+1},Q:{len(queue_list)}): {current_url[:50]}...")
+            st.sidebar.text(f"Crawl (D:{depth},P:{page_count+1},Q:{len(frontier)}): {current_url[:50]}...")
             try:
                 response = session.get(current_url, headers=get_random_headers_general(), timeout=10)
+                response.encoding = 'utf-8'
                 response.raise_for_status()
                 if 'text/html' not in response.headers.get('Content-Type', '').lower(): continue
                 page_count += 1
-                wa_links_from_page = scrape_whatsapp_links_from_page(current_url, session=session)
+                soup = BeautifulSoup(response.text, 'html.parser')
+                wa_links_from_page = extract_whatsapp_links_from_soup(soup)
                 newly_found_count = 0
                 for link in wa_links_from_page:
                     if link.startswith(WHATSAPP_DOMAIN) and link not in scraped_whatsapp_links:
@@ -320,9 +441,12 @@ def crawl_website(start_url, max_depth=2, max_pages=50):
                         newly_found_count += 1
                 if newly_found_count > 0:
                     st.sidebar.info(f"Crawl: Found {newly_found_count} new WA links on {current_url[:30]}...")
+                if discovery_mode:
+                    site_yield[0] += 1; site_yield[1] += len(wa_links_from_page)
+                    for tok in tokenize_for_discovery(urlparse(current_url).path):
+                        stats = token_yield.setdefault(tok, [0, 0]); stats[0] += 1; stats[1] += len(wa_links_from_page)
 
                 if depth < max_depth:
-                    soup = BeautifulSoup(response.text, 'html.parser')
                     for link_tag in soup.find_all('a', href=True):
                         href = link_tag.get('href')
                         if href:
@@ -331,14 +455,12 @@ def crawl_website(start_url, max_depth=2, max_pages=50):
                             if parsed_abs_url.scheme in ['http', 'https'] and \
                                parsed_abs_url.netloc.replace('www.', '') == base_domain and \
                                not parsed_abs_url.fragment:
-                                normalized_abs_url = urljoin(abs_url, parsed_abs_url.path or '/')
-                                if normalized_abs_url not in visited_urls and (abs_url, depth + 1) not in urls_in_queue_tuples:
-                                    queue_list.append((abs_url, depth + 1)); urls_in_queue_tuples.add((abs_url, depth + 1))
+                                enqueue(abs_url, depth + 1, link_tag.get_text(" ", strip=True), len(wa_links_from_page))
             except requests.exceptions.RequestException as e: st.sidebar.warning(f"Crawl Req Err ({type(e).__name__}): {current_url[:50]}...", icon="🕸️")
             except Exception as e: st.sidebar.error(f"Crawl Parse Err ({type(e).__name__}): {current_url[:50]}...", icon="💥")
     st.sidebar.success(f"Crawl done. Scraped {page_count} pages, found {len(scraped_whatsapp_links)} links.")
     if page_count >= max_pages: st.sidebar.warning(f"Stopped at {max_pages} pages.", icon="❗️")
-    if len(queue_list) > max_q_size: st.sidebar.warning(f"Queue capped at {max_q_size}.", icon="❗️")
+    if queue_capped: st.sidebar.warning(f"Queue capped at {max_q_size}.", icon="❗️")
     return scraped_whatsapp_links
 
 def generate_styled_html_table(data_df_for_table):
@@ -379,6 +501,24 @@ def generate_styled_html_table(data_df_for_table):
     html_string += '</tbody></table>'
     return html_string
 
+def render_metric_cards(total_count, active_count, expired_count, other_count):
+    col1, col2, col3, col4 = st.columns(4)
+    col1.markdown(f'<div class="metric-card">Total Processed<br><div class="metric-value">{total_count}</div></div>', unsafe_allow_html=True)
+    col2.markdown(f'<div class="metric-card">Active Links<br><div class="metric-value">{active_count}</div></div>', unsafe_allow_html=True)
+    col3.markdown(f'<div class="metric-card">Expired Links<br><div class="metric-value">{expired_count}</div></div>', unsafe_allow_html=True)
+    col4.markdown(f'<div class="metric-card">Other Status<br><div class="metric-value">{other_count}</div></div>', unsafe_allow_html=True)
+
+def render_live_validation_view(metrics_placeholder, table_placeholder, new_results):
+    # Same de-duplication as the final summary (first result per Group Link wins).
+    statuses = list({res.get("Group Link"): res.get("Status", "") for res in reversed(st.session_state.results)}.values())
+    active_count = sum('Active' in status for status in statuses)
+    expired_count = sum(status == 'Expired' for status in statuses)
+    with metrics_placeholder.container():
+        render_metric_cards(len(statuses), active_count, expired_count, len(statuses) - active_count - expired_count)
+    # Newest first, capped so redraw cost stays flat on large batches.
+    live_df = pd.DataFrame(new_results[-LIVE_RESULTS_PREVIEW_ROWS:][::-1], columns=["Group Name", "Group Link", "Logo URL", "Status"])
+    table_placeholder.dataframe(live_df, column_config=RESULTS_COLUMN_CONFIG, hide_index=True, height=300, use_container_width=True)
+
 # --- Main Application Logic ---
 def main():
     st.markdown('<h1 class="main-title">WhatsApp Link Scraper & Validator 🚀</h1>', unsafe_allow_html=True)
@@ -418,11 +558,12 @@ def main():
         if input_method in ["Search and Scrape from Google", "Search & Scrape from Google (Bulk via Excel)", "Upload Link File (TXT/CSV/Excel)"]:
             gs_top_n = st.slider("Google Results to Scrape (per keyword)", 1, 20, 5, key="gs_top_n_slider", help="Number of Google search result pages to analyze per keyword.")
         
-        crawl_depth, crawl_pages = 2, 50
+        crawl_depth, crawl_pages, crawl_discovery = 2, 50, True
         if input_method == "Scrape from Entire Website (Extensive Crawl)":
             st.warning("⚠️ Extensive crawl can be slow. Use with caution.", icon="🚨")
             crawl_depth = st.slider("Max Crawl Depth", 0, 5, 2, key="crawl_depth_slider")
             crawl_pages = st.slider("Max Pages to Crawl", 1, 300, 50, key="crawl_pages_slider")
+            crawl_discovery = st.checkbox("Smart Discovery (sitemaps + link scoring)", value=True, key="crawl_discovery_checkbox", help="Seeds the crawl from robots.txt/sitemap.xml and visits pages most likely to contain WhatsApp invite links first, instead of a plain breadth-first crawl.")
         
         st.markdown("---")
         if st.button("🗑️ Clear All Results & Reset Filters", use_container_width=True, key="clear_all_button"):
@@ -475,7 +616,7 @@ def main():
             if st.button("Crawl & Scrape", use_container_width=True, key="crawl_button"):
                 if domain:
                     st.info("Starting crawl. Progress in sidebar.")
-                    current_action_scraped_links.update(crawl_website(domain, crawl_depth, crawl_pages))
+                    current_action_scraped_links.update(crawl_website(domain, crawl_depth, crawl_pages, discovery_mode=crawl_discovery))
                     st.success(f"Crawl done. Found {len(current_action_scraped_links)} links.")
                 else: st.warning("Please enter a domain.")
 
@@ -522,7 +663,8 @@ def main():
     if links_to_validate_now:
         st.success(f"Found {len(current_action_scraped_links)} links. Validating {len(links_to_validate_now)} new links...")
         prog_val, stat_val = st.progress(0), st.empty()
-        new_results_this_run = []
+        live_metrics_placeholder, live_table_placeholder = st.empty(), st.empty()
+        new_results_this_run, last_refresh_time = [], 0.0
         with ThreadPoolExecutor(max_workers=MAX_VALIDATION_WORKERS) as executor:
             future_to_link = {executor.submit(validate_link, link): link for link in links_to_validate_now}
             for i, future in enumerate(as_completed(future_to_link)):
@@ -539,11 +681,16 @@ def main():
                     normalized_link_val_err = f"{parsed_url_val_err.scheme}://{parsed_url_val_err.netloc}{parsed_url_val_err.path}"
                     st.session_state.processed_links_in_session.add(normalized_link_val_err)
                     new_results_this_run.append({"Group Name": "Validation Error", "Group Link": link_validated, "Logo URL": "", "Status": f"Validation Failed: {type(val_exc).__name__}"})
-                prog_val.progress((i+1)/len(links_to_validate_now))
-                stat_val.text(f"Validated {i+1}/{len(links_to_validate_now)} links")
+                # Results are stored immediately; the UI is redrawn at most once per LIVE_REFRESH_INTERVAL_SECONDS.
+                st.session_state.results.append(new_results_this_run[-1])
+                is_last = i + 1 == len(links_to_validate_now)
+                if is_last or time.monotonic() - last_refresh_time >= LIVE_REFRESH_INTERVAL_SECONDS:
+                    prog_val.progress((i+1)/len(links_to_validate_now))
+                    stat_val.text(f"Validated {i+1}/{len(links_to_validate_now)} links")
+                    render_live_validation_view(live_metrics_placeholder, live_table_placeholder, new_results_this_run)
+                    last_refresh_time = time.monotonic()
         
-        if new_results_this_run:
-            st.session_state.results.extend(new_results_this_run)
+        live_metrics_placeholder.empty(); live_table_placeholder.empty()
         stat_val.success(f"Validation complete for {len(links_to_validate_now)} new links!")
     elif current_action_scraped_links and not links_to_validate_now:
         st.info("No *new* WhatsApp links found from this action. All were previously processed.")
@@ -559,11 +706,7 @@ def main():
         error_df_master = df_display_master[~df_display_master['Status'].str.contains('Active', na=False) & (df_display_master['Status'] != 'Expired')].copy()
 
         st.subheader("📊 Results Summary")
-        col1, col2, col3, col4 = st.columns(4)
-        col1.markdown(f'<div class="metric-card">Total Processed<br><div class="metric-value">{len(df_display_master)}</div></div>', unsafe_allow_html=True)
-        col2.markdown(f'<div class="metric-card">Active Links<br><div class="metric-value">{len(active_df_all_master)}</div></div>', unsafe_allow_html=True)
-        col3.markdown(f'<div class="metric-card">Expired Links<br><div class="metric-value">{len(expired_df_master)}</div></div>', unsafe_allow_html=True)
-        col4.markdown(f'<div class="metric-card">Other Status<br><div class="metric-value">{len(error_df_master)}</div></div>', unsafe_allow_html=True)
+        render_metric_cards(len(df_display_master), len(active_df_all_master), len(expired_df_master), len(error_df_master))
 
         # Styled Table with Filters
         st.subheader("✨ Active Groups Display (Styled Table)")
@@ -658,12 +801,7 @@ def main():
                     adv_filters_applied = True
             
             st.markdown(f"**Preview of Data for Download/Analysis ({'Filtered' if adv_filters_applied else 'All'} - {len(df_for_adv_download_or_view)} rows):**")
-            st.dataframe(df_for_adv_download_or_view, column_config={
-                "Group Link": st.column_config.LinkColumn("Invite Link", display_text="Join", width="medium"),
-                "Group Name": st.column_config.TextColumn("Group Name", width="large"),
-                "Logo URL": st.column_config.LinkColumn("Logo URL", display_text="View", width="small"),
-                "Status": st.column_config.TextColumn("Status", width="small")
-            }, hide_index=True, height=300, use_container_width=True)
+            st.dataframe(df_for_adv_download_or_view, column_config=RESULTS_COLUMN_CONFIG, hide_index=True, height=300, use_container_width=True)
 
         # Downloads
         st.subheader("📥 Download Results (CSV)")